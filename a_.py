@@ -8,16 +8,235 @@ provided as command line arguments.
 
 import sys
 import time
-import argparse
 import math
-from pynput.mouse import Controller as MouseController, Button, Listener as MouseListener
-from pynput.keyboard import Controller as KeyboardController, Key, KeyCode, Listener as KeyboardListener
 import subprocess
 import re
 import platform
 import json
 import os
 import shlex
+import functools
+import contextlib
+import threading
+import multiprocessing
+import queue
+
+# orjson reads and writes large sequence and recording files much faster
+# when it is installed; its errors subclass json.JSONDecodeError
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        """Serialize obj as compact JSON bytes."""
+        return json.dumps(obj).encode()
+
+# Patterns used to parse screen resolution from platform tools
+_XRANDR_CONNECTED_RE = re.compile(r' connected( primary)? (\d+)x(\d+)')
+_XRANDR_MONITOR_RE = re.compile(
+    r'^(\S+) connected (primary )?(\d+)x(\d+)\+(\d+)\+(\d+)', re.MULTILINE)
+_MAC_RES_RE = re.compile(r'Resolution: (\d+) x (\d+)')
+_MAC_ORIGIN_RE = re.compile(r'Origin: \((\d+), (\d+)\)')
+_RES_OVERRIDE_RE = re.compile(r'\s*(\d+)\s*x\s*(\d+)\s*')
+
+# Modifier keys that can be held, mapped to their pynput Key names.
+# pynput itself is imported only where it is used, so that --help and
+# argument errors don't pay for loading the input backends.
+_MODIFIER_KEY_MAP = {
+    'cmd': 'cmd',
+    'command': 'cmd',
+    'win': 'cmd',
+    'windows': 'cmd',
+    'ctrl': 'ctrl',
+    'control': 'ctrl',
+    'alt': 'alt',
+    'shift': 'shift'
+}
+
+# Order in which multiple modifier keys are pressed
+_MODIFIER_ORDER = ['ctrl', 'alt', 'shift', 'cmd', 'win', 'windows']
+
+# Operating system name, looked up once for all platform dispatch
+_SYSTEM = platform.system()
+
+# PowerShell command prefix; skipping the user's profile saves seconds per
+# call on some systems, and scripts never prompt for input
+_POWERSHELL = ['powershell', '-NoProfile', '-NonInteractive', '-Command']
+
+# Coordinates inside this area fit on any display, so bounds checks
+# only need to query the real screen size for points beyond it
+_SAFE_SCREEN_WIDTH = 1024
+_SAFE_SCREEN_HEIGHT = 768
+
+
+def _read_smooth_rate(default=120.0):
+    """Return A_SMOOTH_RATE if it is a positive number, otherwise default."""
+    try:
+        rate = float(os.environ.get("A_SMOOTH_RATE", default))
+    except ValueError:
+        return default
+    return rate if 0 < rate < math.inf else default
+
+
+# Maximum smooth movement updates per second (override with A_SMOOTH_RATE)
+_SMOOTH_RATE = _read_smooth_rate()
+
+# Final part of a timed wait spent polling the clock instead of sleeping
+_SPIN_INTERVAL = 0.001
+
+# Shared mouse and keyboard controllers, created on first use. Parallel
+# sequences can ask for them at the same time, so creation is locked.
+_MOUSE = None
+_KEYBOARD = None
+_CONTROLLER_LOCK = threading.Lock()
+
+
+def _mouse():
+    """Return the shared mouse controller, creating it on first use."""
+    global _MOUSE
+    if _MOUSE is None:
+        with _CONTROLLER_LOCK:
+            if _MOUSE is None:
+                from pynput.mouse import Controller
+                _MOUSE = Controller()
+    return _MOUSE
+
+
+def _keyboard():
+    """Return the shared keyboard controller, creating it on first use."""
+    global _KEYBOARD
+    if _KEYBOARD is None:
+        with _CONTROLLER_LOCK:
+            if _KEYBOARD is None:
+                from pynput.keyboard import Controller
+                _KEYBOARD = Controller()
+    return _KEYBOARD
+
+
+@functools.lru_cache(maxsize=1)
+def _key_map():
+    """Return pynput's special keys by name, looked up once on first use."""
+    from pynput.keyboard import Key
+    return dict(Key.__members__)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_key(name):
+    """
+    Resolve a key name to something the keyboard controller can press.
+
+    Args:
+        name (str): Special key name (e.g. 'enter'), single character, or a
+            '<vk>' virtual key code as written by record mode for keys
+            without a character
+
+    Returns:
+        Key, KeyCode or str: The key to press, or None if the name is unknown
+    """
+    key = _key_map().get(name)
+    if key is not None:
+        return key
+    if len(name) == 1:
+        return name
+    if name[:1] == '<' and name[-1:] == '>' and name[1:-1].isdigit():
+        from pynput.keyboard import KeyCode
+        return KeyCode.from_vk(int(name[1:-1]))
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _button_map():
+    """Return pynput's mouse buttons by name, looked up once on first use."""
+    from pynput.mouse import Button
+    return {'left': Button.left, 'right': Button.right, 'middle': Button.middle}
+
+
+if _SYSTEM == "Windows":
+    import ctypes
+
+# Clicks go through pynput unless A_FAST_INPUT=1 opts in to direct user32
+# calls on Windows
+if _SYSTEM == "Windows" and os.environ.get("A_FAST_INPUT") == "1":
+    # MOUSEEVENTF_*DOWN and MOUSEEVENTF_*UP flags for each button
+    _MOUSE_EVENT_FLAGS = {
+        'left': (0x0002, 0x0004),
+        'right': (0x0008, 0x0010),
+        'middle': (0x0020, 0x0040)
+    }
+
+    def _click_button(button):
+        """Press and release a mouse button with direct user32 calls."""
+        down, up = _MOUSE_EVENT_FLAGS[button.name]
+        ctypes.windll.user32.mouse_event(down, 0, 0, 0, 0)
+        ctypes.windll.user32.mouse_event(up, 0, 0, 0, 0)
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", ctypes.c_long),
+                    ("dy", ctypes.c_long),
+                    ("mouseData", ctypes.c_ulong),
+                    ("dwFlags", ctypes.c_ulong),
+                    ("time", ctypes.c_ulong),
+                    ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _INPUT(ctypes.Structure):
+        # MOUSEINPUT is the largest member of the INPUT union, so it
+        # alone gives the structure its native size
+        _fields_ = [("type", ctypes.c_ulong),
+                    ("mi", _MOUSEINPUT)]
+
+    def _click_burst(button, count):
+        """Click a mouse button count times with a single SendInput call."""
+        down, up = _MOUSE_EVENT_FLAGS[button.name]
+        events = (_INPUT * (count * 2))()
+        for i in range(count):
+            events[2 * i].mi.dwFlags = down
+            events[2 * i + 1].mi.dwFlags = up
+        ctypes.windll.user32.SendInput(
+            len(events), events, ctypes.sizeof(_INPUT))
+else:
+    def _click_button(button):
+        """Press and release a mouse button through the shared controller."""
+        mouse = _mouse()
+        mouse.press(button)
+        mouse.release(button)
+
+    def _click_burst(button, count):
+        """Click a mouse button count times back to back."""
+        for _ in range(count):
+            _click_button(button)
+
+
+if _SYSTEM == "Windows":
+    def _set_position(x, y):
+        """Move the cursor with a direct user32 call, skipping pynput."""
+        ctypes.windll.user32.SetCursorPos(int(x), int(y))
+
+    @contextlib.contextmanager
+    def _fine_timer_resolution():
+        """Lower the system timer period to 1 ms for precise short sleeps."""
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        try:
+            yield
+        finally:
+            ctypes.windll.winmm.timeEndPeriod(1)
+else:
+    def _set_position(x, y):
+        """Move the cursor through the shared pynput controller."""
+        _mouse().position = (x, y)
+
+    # Sleeps are already fine-grained outside Windows
+    _fine_timer_resolution = contextlib.nullcontext
+
+
+@functools.lru_cache(maxsize=1)
+def _has_wmctrl():
+    """Return whether wmctrl is installed, checking the PATH only once."""
+    import shutil
+    return shutil.which('wmctrl') is not None
 
 
 def find_window_linux(title=None, process=None):
@@ -31,10 +250,7 @@ def find_window_linux(title=None, process=None):
     Returns:
         tuple: (window_id, window_title) or (None, None) if not found
     """
-    try:
-        # Check if wmctrl is installed
-        subprocess.run(['which', 'wmctrl'], check=True, capture_output=True)
-    except subprocess.CalledProcessError:
+    if not _has_wmctrl():
         print("Error: wmctrl is not installed. Please install it using:")
         print("sudo apt-get install wmctrl")
         return None, None
@@ -56,12 +272,14 @@ def find_window_linux(title=None, process=None):
 
             # If process name is specified, check if it matches
             if process:
+                # Read the process name straight from /proc instead of
+                # running ps (it holds the same name ps reports as comm)
                 try:
-                    proc_name = subprocess.check_output(
-                        ['ps', '-p', pid, '-o', 'comm='], text=True).strip()
-                    if process.lower() not in proc_name.lower():
-                        continue
-                except subprocess.CalledProcessError:
+                    with open(f'/proc/{pid}/comm') as f:
+                        proc_name = f.read().strip()
+                except OSError:
+                    continue
+                if process.lower() not in proc_name.lower():
                     continue
 
             # If title is specified, check if it matches
@@ -172,7 +390,7 @@ def find_window_windows(title=None, process=None):
             return None, None
 
         result = subprocess.check_output(
-            ['powershell', '-Command', script], text=True)
+            _POWERSHELL + [script], text=True)
         if result:
             return "windows_window", result.strip()
 
@@ -229,7 +447,7 @@ def activate_window_windows(window_title):
             [Win32]::SetForegroundWindow($hwnd)
         }}
         '''
-        subprocess.run(['powershell', '-Command', script], check=True)
+        subprocess.run(_POWERSHELL + [script], check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error activating window: {e}")
@@ -250,7 +468,7 @@ def find_and_activate_window(title=None, process=None, wait=1, required=True, re
     Returns:
         bool: True if window was found and activated, False otherwise
     """
-    system = platform.system()
+    system = _SYSTEM
 
     for attempt in range(retry_count):
         if attempt > 0:
@@ -265,6 +483,9 @@ def find_and_activate_window(title=None, process=None, wait=1, required=True, re
             window_id, window_title = find_window_linux(title, process)
             if window_id:
                 success = activate_window_linux(window_id)
+            elif not _has_wmctrl():
+                # Retrying can't help until wmctrl is installed
+                break
         elif system == "Darwin":  # macOS
             window_id, window_title = find_window_macos(title, process)
             if window_id:
@@ -292,99 +513,44 @@ def find_and_activate_window(title=None, process=None, wait=1, required=True, re
     return False
 
 
-def get_all_monitors():
+@functools.lru_cache(maxsize=1)
+def _query_monitors():
     """
-    Get information about all connected monitors.
+    Query the platform tools for the connected monitors.
+
+    The result is cached for the lifetime of the process, since each query
+    spawns a subprocess. Call invalidate_screen_cache() to force a fresh one.
 
     Returns:
-        list: List of dictionaries containing monitor information
-              Each dictionary has keys: 'index', 'x', 'y', 'width', 'height', 'primary'
+        tuple: (monitors, error) where monitors is a tuple of monitor
+               dictionaries, empty if detection failed, and error describes
+               the failure or is None
     """
     monitors = []
-    system = platform.system()
+    error = None
+    system = _SYSTEM
 
     if system == "Linux":
         try:
-            # Use xrandr to get monitor information
+            # Use xrandr to get monitor information (C locale keeps the
+            # "connected"/"primary" keywords untranslated)
             output = subprocess.check_output(
-                ["xrandr", "--current"], text=True)
-
-            # Parse the output to extract monitor information
-            current_monitor = None
-            monitor_index = 0
-
-            for line in output.split('\n'):
-                # Check for connected displays
-                if " connected " in line:
-                    monitor_name = line.split(' ')[0]
-                    is_primary = "primary" in line
-
-                    # Extract resolution and position if available in this line
-                    position_match = re.search(
-                        r'(\d+)x(\d+)\+(\d+)\+(\d+)', line)
-
-                    if position_match:
-                        width = int(position_match.group(1))
-                        height = int(position_match.group(2))
-                        x = int(position_match.group(3))
-                        y = int(position_match.group(4))
-
-                        monitors.append({
-                            'index': monitor_index,
-                            'name': monitor_name,
-                            'x': x,
-                            'y': y,
-                            'width': width,
-                            'height': height,
-                            'primary': is_primary
-                        })
-
-                        monitor_index += 1
-                    else:
-                        current_monitor = {
-                            'index': monitor_index,
-                            'name': monitor_name,
-                            'primary': is_primary
-                        }
-
-                # If we have a current monitor but no position yet, look for resolution line
-                elif current_monitor and line.strip().startswith(current_monitor['name']):
-                    position_match = re.search(
-                        r'(\d+)x(\d+)\+(\d+)\+(\d+)', line)
-
-                    if position_match:
-                        width = int(position_match.group(1))
-                        height = int(position_match.group(2))
-                        x = int(position_match.group(3))
-                        y = int(position_match.group(4))
-
-                        current_monitor.update({
-                            'x': x,
-                            'y': y,
-                            'width': width,
-                            'height': height
-                        })
-
-                        monitors.append(current_monitor)
-                        current_monitor = None
-                        monitor_index += 1
-
-                # If we're processing a monitor and find a resolution line
-                elif current_monitor and "*current" in line:
-                    res_match = re.search(r'(\d+)x(\d+)', line)
-                    if res_match:
-                        current_monitor['width'] = int(res_match.group(1))
-                        current_monitor['height'] = int(res_match.group(2))
-                        # Assume position 0,0 if not specified
-                        current_monitor['x'] = current_monitor.get('x', 0)
-                        current_monitor['y'] = current_monitor.get('y', 0)
-
-                        monitors.append(current_monitor)
-                        current_monitor = None
-                        monitor_index += 1
+                ["xrandr", "--current"], text=True, env=dict(os.environ, LC_ALL="C"))
+
+            # Each enabled monitor's connected line carries its geometry
+            for monitor_index, match in enumerate(_XRANDR_MONITOR_RE.finditer(output)):
+                monitors.append({
+                    'index': monitor_index,
+                    'name': match.group(1),
+                    'x': int(match.group(5)),
+                    'y': int(match.group(6)),
+                    'width': int(match.group(3)),
+                    'height': int(match.group(4)),
+                    'primary': bool(match.group(2))
+                })
 
         except (subprocess.SubprocessError, FileNotFoundError) as e:
-            print(f"Error detecting monitors using xrandr: {e}")
+            error = f"Error detecting monitors using xrandr: {e}"
 
     elif system == "Darwin":  # macOS
         try:
@@ -398,13 +564,13 @@ def get_all_monitors():
 
             for line in output.split('\n'):
                 if "Resolution:" in line:
-                    res_match = re.search(r'Resolution: (\d+) x (\d+)', line)
+                    res_match = _MAC_RES_RE.search(line)
                     if res_match and current_monitor:
                         current_monitor['width'] = int(res_match.group(1))
                         current_monitor['height'] = int(res_match.group(2))
 
                 elif "Origin:" in line:
-                    origin_match = re.search(r'Origin: \((\d+), (\d+)\)', line)
+                    origin_match = _MAC_ORIGIN_RE.search(line)
                     if origin_match and current_monitor:
                         current_monitor['x'] = int(origin_match.group(1))
                         current_monitor['y'] = int(origin_match.group(2))
@@ -440,7 +606,7 @@ def get_all_monitors():
                 monitors.append(current_monitor)
 
         except (subprocess.SubprocessError, FileNotFoundError) as e:
-            print(f"Error detecting monitors using system_profiler: {e}")
+            error = f"Error detecting monitors using system_profiler: {e}"
 
     elif system == "Windows":
         try:
@@ -454,7 +620,7 @@ def get_all_monitors():
             }
             """
             output = subprocess.check_output(
-                ["powershell", "-Command", ps_command], text=True)
+                _POWERSHELL + [ps_command], text=True)
 
             for i, line in enumerate(output.strip().split('\n')):
                 parts = line.strip().split(',')
@@ -471,7 +637,36 @@ def get_all_monitors():
                     })
 
         except (subprocess.SubprocessError, FileNotFoundError) as e:
-            print(f"Error detecting monitors using PowerShell: {e}")
+            error = f"Error detecting monitors using PowerShell: {e}"
+
+    return tuple(monitors), error
+
+
+def _detect_monitors(quiet=False):
+    """
+    Get the connected monitors, reporting why detection failed.
+
+    Args:
+        quiet (bool): Don't print the detection error
+
+    Returns:
+        tuple: Monitor dictionaries, empty if detection failed
+    """
+    monitors, error = _query_monitors()
+    if error and not quiet:
+        print(error)
+    return monitors
+
+
+def get_all_monitors():
+    """
+    Get information about all connected monitors.
+
+    Returns:
+        list: List of dictionaries containing monitor information
+              Each dictionary has keys: 'index', 'x', 'y', 'width', 'height', 'primary'
+    """
+    monitors = list(_detect_monitors())
 
     # If no monitors were detected, add a fallback monitor
     if not monitors:
@@ -490,15 +685,28 @@ def get_all_monitors():
     return monitors
 
 
+@functools.lru_cache(maxsize=1)
 def get_screen_resolution():
     """
     Get the screen resolution of the primary monitor.
 
+    The result is cached for the lifetime of the process. Call
+    invalidate_screen_cache() to force a fresh query.
+
+    Setting the A_SCREEN_RESOLUTION environment variable (e.g. "1920x1080")
+    skips detection entirely, which is useful for headless or CI runs.
+
     Returns:
         tuple: (width, height) of the primary monitor
     """
-    # Try to get all monitors first
-    monitors = get_all_monitors()
+    override = _RES_OVERRIDE_RE.fullmatch(os.environ.get("A_SCREEN_RESOLUTION", ""))
+    if override:
+        return int(override.group(1)), int(override.group(2))
+
+    # Try the detected monitors first; get_all_monitors() would fall back
+    # to this function when there are none. A failed detection isn't
+    # reported, since the fallbacks below cover it.
+    monitors = _detect_monitors(quiet=True)
 
     # Find the primary monitor
     for monitor in monitors:
@@ -510,33 +718,53 @@ def get_screen_resolution():
         return monitors[0]['width'], monitors[0]['height']
 
     # Fallback methods if get_all_monitors failed
-    system = platform.system()
+    system = _SYSTEM
 
     if system == "Linux":
         try:
             # Try using xrandr command
-            output = subprocess.check_output(["xrandr"], text=True)
-            # Look for the primary display
-            for line in output.split('\n'):
-                if " connected primary " in line:
-                    match = re.search(r'(\d+)x(\d+)', line)
-                    if match:
-                        return int(match.group(1)), int(match.group(2))
-
-            # If primary not found, use the first connected display
-            for line in output.split('\n'):
-                if " connected " in line:
-                    match = re.search(r'(\d+)x(\d+)', line)
-                    if match:
-                        return int(match.group(1)), int(match.group(2))
+            output = subprocess.check_output(
+                ["xrandr", "--current"], text=True, env=dict(os.environ, LC_ALL="C"))
+            # Look for the primary display, remembering the first connected
+            # one as a fallback, in a single scan of the output.
+            # A plain substring check rules out the scan before running it.
+            first_match = None
+            if " connected " in output:
+                for match in _XRANDR_CONNECTED_RE.finditer(output):
+                    if match.group(1):
+                        return int(match.group(2)), int(match.group(3))
+                    if first_match is None:
+                        first_match = match
+            if first_match:
+                return int(first_match.group(2)), int(first_match.group(3))
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
 
+        try:
+            # Ask the X server directly (python-xlib is installed with pynput)
+            from Xlib import display
+            x_display = display.Display()
+            try:
+                screen = x_display.screen()
+                return screen.width_in_pixels, screen.height_in_pixels
+            finally:
+                x_display.close()
+        except Exception:
+            pass
+
     elif system == "Darwin":  # macOS
+        try:
+            # Quartz is installed alongside pynput on macOS
+            from Quartz import CGMainDisplayID, CGDisplayPixelsWide, CGDisplayPixelsHigh
+            display_id = CGMainDisplayID()
+            return CGDisplayPixelsWide(display_id), CGDisplayPixelsHigh(display_id)
+        except ImportError:
+            pass
+
         try:
             output = subprocess.check_output(
                 ["system_profiler", "SPDisplaysDataType"], text=True)
-            match = re.search(r'Resolution: (\d+) x (\d+)', output)
+            match = _MAC_RES_RE.search(output)
             if match:
                 return int(match.group(1)), int(match.group(2))
         except (subprocess.SubprocessError, FileNotFoundError):
@@ -544,32 +772,64 @@ def get_screen_resolution():
 
     elif system == "Windows":
         try:
-            # Using powershell to get screen resolution
-            command = "powershell \"(Get-WmiObject -Class Win32_VideoController).VideoModeDescription\""
-            output = subprocess.check_output(command, shell=True, text=True)
-            match = re.search(r'(\d+) x (\d+)', output)
-            if match:
-                return int(match.group(1)), int(match.group(2))
-        except (subprocess.SubprocessError, FileNotFoundError):
+            # Query user32 directly (SM_CXSCREEN, SM_CYSCREEN)
+            import ctypes
+            user32 = ctypes.windll.user32
+            width, height = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+            if width and height:
+                return width, height
+        except (AttributeError, OSError):
             pass
 
-    # Fallback: Get current mouse position and move it to extreme positions
-    mouse = MouseController()
-    original_pos = mouse.position
+    # Fallback: Ask Tk for the screen size without touching the cursor
+    try:
+        import tkinter
+        root = tkinter.Tk()
+        root.withdraw()
+        width, height = root.winfo_screenwidth(), root.winfo_screenheight()
+        root.destroy()
+
+        # If we got some reasonable values
+        if width > 100 and height > 100:
+            return width, height
+    except Exception:
+        pass
+
+    # Last resort default
+    return (1920, 1080)
+
 
-    # Try to find screen boundaries by moving to extreme positions
-    mouse.position = (100000, 100000)  # Move to a very large position
-    max_pos = mouse.position
+@functools.lru_cache(maxsize=1)
+def _desktop_rects():
+    """
+    Get the area each monitor covers on the virtual desktop.
 
-    # Restore original position
-    mouse.position = original_pos
+    Monitors left of or above the primary one have negative coordinates.
+    With A_SCREEN_RESOLUTION set, the desktop is that single screen.
 
-    # If we got some reasonable values
-    if max_pos[0] > 100 and max_pos[1] > 100:
-        return max_pos
+    Only the platform monitor queries are used, never the Tk fallback of
+    get_screen_resolution(), so this is safe to call off the main thread.
 
-    # Last resort default
-    return (1920, 1080)
+    Returns:
+        tuple: (left, top, right, bottom) global bounds of each monitor,
+               with right and bottom exclusive; empty if detection failed
+    """
+    if _RES_OVERRIDE_RE.fullmatch(os.environ.get("A_SCREEN_RESOLUTION", "")):
+        width, height = get_screen_resolution()
+        return ((0, 0, width, height),)
+    return tuple((m['x'], m['y'], m['x'] + m['width'], m['y'] + m['height'])
+                 for m in _detect_monitors(quiet=True))
+
+
+def invalidate_screen_cache():
+    """
+    Forget the cached screen resolution and monitor layout so the next
+    lookup queries the system again, e.g. after a display has been
+    connected or disconnected.
+    """
+    get_screen_resolution.cache_clear()
+    _query_monitors.cache_clear()
+    _desktop_rects.cache_clear()
 
 
 def get_monitor_by_index(index):
@@ -648,30 +908,70 @@ def convert_to_global_coordinates(x, y, monitor_index=None):
     return x, y
 
 
-def monitor_mouse_position(update_interval=0.1, show_clicks=True, duration=None):
+# Status line written on each monitor update, and how often it is flushed.
+# Without click tracking the click columns are baked in as zeros.
+_MONITOR_LINE = "{:10.2f} | {:6} | {:6} | {:12} | {:12}\r".format
+_MONITOR_LINE_NO_CLICKS = ("{:10.2f} | {:6} | {:6} | " + f"{0:12} | {0:12}" + "\r").format
+_MONITOR_FLUSH_INTERVAL = 0.05
+
+
+def _click_listener_worker(clicks):
     """
-    Monitor and display the current mouse position in real-time.
+    Listen for mouse clicks and report them on a queue.
+
+    Runs in a separate process started by monitor_mouse_position.
 
     Args:
-        update_interval (float): Time between position updates in seconds
-        show_clicks (bool): Whether to show mouse click events
-        duration (float): How long to monitor in seconds (None for indefinite)
+        clicks (multiprocessing.Queue): Receives (x, y, button_name) tuples
     """
-    mouse = MouseController()
-    start_time = time.time()
-    click_count = {'left': 0, 'right': 0}
+    import signal
+
+    # Ctrl+C in the terminal reaches this process too; leave stopping it to
+    # the parent's terminate() instead of printing a KeyboardInterrupt
+    # traceback over the monitor output
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from pynput.mouse import Button, Listener as MouseListener
 
     def on_click(x, y, button, pressed):
         if pressed:
             btn_name = 'left' if button == Button.left else 'right' if button == Button.right else 'middle'
-            click_count[btn_name if btn_name in click_count else 'other'] = click_count.get(
-                btn_name, 0) + 1
-            print(f"Mouse {btn_name} button clicked at ({x}, {y})")
+            clicks.put((x, y, btn_name))
 
-    # Start the listener if showing clicks
+    with MouseListener(on_click=on_click) as listener:
+        listener.join()
+
+
+def monitor_mouse_position(update_interval=0.1, show_clicks=True, duration=None):
+    """
+    Monitor and display the current mouse position in real-time.
+
+    Args:
+        update_interval (float): Time between position updates in seconds
+        show_clicks (bool): Whether to show mouse click events
+        duration (float): How long to monitor in seconds (None for indefinite)
+    """
+    mouse = _mouse()
+    start_time = time.monotonic()
+    left_clicks = 0
+    right_clicks = 0
+
+    def on_click(x, y, btn_name):
+        nonlocal left_clicks, right_clicks
+        if btn_name == 'left':
+            left_clicks += 1
+        elif btn_name == 'right':
+            right_clicks += 1
+        print(f"Mouse {btn_name} button clicked at ({x}, {y})")
+
+    # Start the listener in its own process if showing clicks, so its OS
+    # hook callbacks never wait on this process's interpreter
     listener = None
+    clicks = None
     if show_clicks:
-        listener = MouseListener(on_click=on_click)
+        clicks = multiprocessing.Queue()
+        listener = multiprocessing.Process(
+            target=_click_listener_worker, args=(clicks,), daemon=True)
         listener.start()
 
     try:
@@ -681,35 +981,126 @@ def monitor_mouse_position(update_interval=0.1, show_clicks=True, duration=None)
             f"{'Time (s)':10} | {'X':6} | {'Y':6} | {'Left Clicks':12} | {'Right Clicks':12}")
         print("-" * 50)
 
+        # Bind loop callables to locals to avoid repeated global lookups
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        monotonic = time.monotonic
+        line = _MONITOR_LINE if show_clicks else _MONITOR_LINE_NO_CLICKS
+        last_flush = 0
+
         while True:
-            current_time = time.time() - start_time
+            current_time = monotonic() - start_time
             x, y = mouse.position
 
-            # Format and print the current position
-            print(f"{current_time:10.2f} | {x:6} | {y:6} | {click_count.get('left', 0):12} | {click_count.get('right', 0):12}", end='\r')
+            # Format and write the current position, flushing at most
+            # every _MONITOR_FLUSH_INTERVAL seconds
+            write(line(current_time, x, y, left_clicks, right_clicks))
+            if current_time - last_flush >= _MONITOR_FLUSH_INTERVAL:
+                flush()
+                last_flush = current_time
 
             # Check if duration has elapsed
             if duration is not None and current_time >= duration:
                 break
 
-            time.sleep(update_interval)
+            # Wait until the next update, but never past the end of the
+            # monitoring duration
+            deadline = monotonic() + update_interval
+            if duration is not None:
+                deadline = min(deadline, start_time + duration)
+
+            if clicks is None:
+                time.sleep(max(0, deadline - monotonic()))
+                continue
+
+            # Block on the click queue so clicks are handled as they arrive
+            try:
+                while True:
+                    on_click(*clicks.get(timeout=max(0, deadline - monotonic())))
+            except queue.Empty:
+                pass
 
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped by user.")
     finally:
         if listener:
-            listener.stop()
+            listener.terminate()
+            listener.join()
 
         # Print summary
-        end_time = time.time() - start_time
+        end_time = time.monotonic() - start_time
         print("\n" + "=" * 50)
         print(f"Monitoring session summary:")
         print(f"- Duration: {end_time:.2f} seconds")
-        print(f"- Left clicks: {click_count.get('left', 0)}")
-        print(f"- Right clicks: {click_count.get('right', 0)}")
+        print(f"- Left clicks: {left_clicks}")
+        print(f"- Right clicks: {right_clicks}")
         print("=" * 50)
 
 
+def _sleep_until(deadline):
+    """
+    Sleep until time.perf_counter() reaches deadline.
+
+    Most of the wait is a regular sleep; the final stretch is spent
+    polling the clock, since OS sleeps can overshoot by a scheduler tick.
+    """
+    perf_counter = time.perf_counter
+    remaining = deadline - perf_counter()
+    if remaining > _SPIN_INTERVAL:
+        time.sleep(remaining - _SPIN_INTERVAL)
+    while perf_counter() < deadline:
+        pass
+
+
+def _ease_in_out_quad(t):
+    """Quadratic easing function for smooth acceleration and deceleration"""
+    if t < 0.5:
+        return 2 * t * t
+    t = 2 * t - 2
+    return -0.5 * (t * t - 2)
+
+
+@functools.lru_cache(maxsize=32)
+def _ease_curve(steps):
+    """Return the eased progress values (0.0 to 1.0) for a given step count."""
+    return tuple(_ease_in_out_quad(step / steps) for step in range(steps + 1))
+
+
+@functools.lru_cache(maxsize=128)
+def _smooth_trajectory(start_x, start_y, end_x, end_y, steps):
+    """
+    Compute the intermediate positions of a smooth movement.
+
+    Args:
+        start_x (int): Starting X coordinate
+        start_y (int): Starting Y coordinate
+        end_x (int): Ending X coordinate
+        end_y (int): Ending Y coordinate
+        steps (int): Number of intermediate steps
+
+    Results are cached, so repeated moves along the same path (e.g. in
+    repeated sequences or replays) reuse the computed trajectory.
+
+    Returns:
+        tuple: (step, x, y) integer positions using quadratic easing, for
+               the first step and every later step that lands on a new pixel
+    """
+    dx = end_x - start_x
+    dy = end_y - start_y
+    eases = _ease_curve(steps)
+    # Straight horizontal or vertical moves keep one axis constant
+    xs = tuple(int(start_x + dx * ease) for ease in eases) if dx else (start_x,) * len(eases)
+    ys = tuple(int(start_y + dy * ease) for ease in eases) if dy else (start_y,) * len(eases)
+
+    # Easing crawls near both ends, where several steps round to the same
+    # pixel; keep only the steps that actually move the cursor
+    path = [(0, xs[0], ys[0])]
+    for step in range(1, len(xs)):
+        if xs[step] != xs[step - 1] or ys[step] != ys[step - 1]:
+            path.append((step, xs[step], ys[step]))
+    return tuple(path)
+
+
 def smooth_move(start_x, start_y, end_x, end_y, duration=1.0, steps=100):
     """
     Move the mouse smoothly from start position to end position.
@@ -722,8 +1113,6 @@ def smooth_move(start_x, start_y, end_x, end_y, duration=1.0, steps=100):
         duration (float): Total duration of the movement in seconds
         steps (int): Number of intermediate steps
     """
-    mouse = MouseController()
-
     # Calculate the distance to move
     dx = end_x - start_x
     dy = end_y - start_y
@@ -732,50 +1121,216 @@ def smooth_move(start_x, start_y, end_x, end_y, duration=1.0, steps=100):
     # Adjust steps based on distance (more steps for longer distances)
     steps = min(max(int(distance / 5), 50), 150)  # Between 50 and 150 steps
 
-    # Calculate the time to sleep between steps
-    sleep_time = duration / steps
+    # Don't issue more steps than the display can show in the given time
+    steps = min(steps, max(2, int(duration * _SMOOTH_RATE)))
 
     print(
         f"Moving mouse smoothly from ({start_x}, {start_y}) to ({end_x}, {end_y}) over {duration} seconds")
 
-    def ease_in_out_quad(t):
-        """Quadratic easing function for smooth acceleration and deceleration"""
-        if t < 0.5:
-            return 2 * t * t
-        t = 2 * t - 2
-        return -0.5 * (t * t - 2)
+    # Too short to show any intermediate frame, so jump straight there
+    if duration < 1 / _SMOOTH_RATE:
+        _set_position(end_x, end_y)
+        return
 
-    # Move in steps using quadratic easing
-    for step in range(steps + 1):
-        t = step / steps
-        # Apply easing
-        ease = ease_in_out_quad(t)
+    # Calculate the time to sleep between steps
+    sleep_time = duration / steps
+
+    # Compute the whole path up front so the loop only moves and sleeps
+    path = _smooth_trajectory(start_x, start_y, end_x, end_y, steps)
+
+    # Bind hot-loop callables to locals to avoid repeated global lookups
+    set_position = _set_position
+    sleep_until = _sleep_until
+
+    with _fine_timer_resolution():
+        start_time = time.perf_counter()
+        for step, x, y in path:
+            # Sleep until this step's deadline so timing errors don't
+            # accumulate, then move to the intermediate position
+            sleep_until(start_time + step * sleep_time)
+            set_position(x, y)
+
+        # Steps that didn't move still take their share of the duration
+        sleep_until(start_time + (steps + 1) * sleep_time)
+
+    # Ensure we end up exactly at the target position, skipping the extra
+    # move when the last step already landed there
+    if path[-1][1] != end_x or path[-1][2] != end_y:
+        set_position(end_x, end_y)
+
+
+def _perform_window_action(action, held_keys):
+    """Find and activate a window; returns False if the sequence should stop."""
+    get = action.get
+    window_found = find_and_activate_window(
+        title=get('title'),
+        process=get('process'),
+        wait=get('wait', 1.0),
+        required=not get('not_required', False),
+        retry_count=get('retry_count', 3)
+    )
+    if not window_found and not get('not_required', False):
+        print("Stopping sequence due to window not found")
+        return False
+    return True
 
-        # Calculate intermediate position
-        ix = start_x + dx * ease
-        iy = start_y + dy * ease
 
-        # Move to intermediate position
-        mouse.position = (int(ix), int(iy))
+def _perform_hold_key_action(action, held_keys):
+    """Hold a key until a release_key action or the end of the sequence."""
+    key = action.get('key')
+    if key:
+        held_keys[key] = hold_key(key)
+        print(f"Holding {key} key...")
+    return True
 
-        # Sleep for a fixed time between steps
-        time.sleep(sleep_time)
 
-    # Ensure we end up exactly at the target position
-    mouse.position = (end_x, end_y)
+def _perform_release_key_action(action, held_keys):
+    """Release one held key, or all of them with 'all'."""
+    key = action.get('key')
+    if key and key in held_keys:
+        release_key(held_keys[key])
+        del held_keys[key]
+        print(f"Released {key} key")
+    elif action.get('all', False):
+        # Release all held keys
+        for k, obj in held_keys.items():
+            release_key(obj)
+            print(f"Released {k} key")
+        held_keys.clear()
+    return True
+
+
+def _perform_move_action(action, held_keys):
+    """Move the mouse as described by a move action."""
+    get = action.get
+    move_mouse(
+        action['x'],
+        action['y'],
+        delay=get('delay', 0),
+        check_bounds=get('check_bounds', True),
+        smooth=get('smooth', False),
+        smooth_duration=get('smooth_duration', 1.0),
+        smooth_steps=get('smooth_steps', 100),
+        monitor_index=get('monitor_index'),
+        bounds_policy=get('bounds_policy')
+    )
+    return True
+
+
+def _perform_click_action(action, held_keys):
+    """Click as described by a click action."""
+    get = action.get
+    perform_click(
+        button=get('button', 'left'),
+        count=get('count', 1),
+        interval=get('interval', 0.1),
+        double=get('double', False),
+        delay_after=get('delay_after', 0)
+    )
+    return True
+
+
+def _perform_scroll_action(action, held_keys):
+    """Scroll as described by a scroll action."""
+    get = action.get
+    perform_scroll(
+        amount=action['amount'],
+        steps=get('steps', 10),
+        interval=get('interval', 0.01),
+        delay_after=get('delay_after', 0)
+    )
+    return True
+
+
+def _perform_key_action(action, held_keys):
+    """Press a key as described by a key action."""
+    get = action.get
+    perform_key_press(
+        action['key'],
+        modifiers=get('modifiers'),
+        count=get('count', 1),
+        interval=get('interval', 0.1),
+        delay_after=get('delay_after', 0)
+    )
+    return True
+
+
+def _perform_type_action(action, held_keys):
+    """Type text as described by a type action."""
+    get = action.get
+    perform_type(
+        action['text'],
+        interval=get('interval', 0.05),
+        delay_after=get('delay_after', 0)
+    )
+    return True
+
+
+def _perform_wait_action(action, held_keys):
+    """Wait for the number of seconds given by a wait action."""
+    delay = action.get('seconds', 1.0)
+    print(f"Waiting {delay} seconds...")
+    _sleep_until(time.perf_counter() + delay)
+    return True
+
+
+# Handler for each sequence action type
+_ACTION_HANDLERS = {
+    'window': _perform_window_action,
+    'hold_key': _perform_hold_key_action,
+    'release_key': _perform_release_key_action,
+    'move': _perform_move_action,
+    'click': _perform_click_action,
+    'scroll': _perform_scroll_action,
+    'key': _perform_key_action,
+    'type': _perform_type_action,
+    'wait': _perform_wait_action
+}
+
+
+def _perform_action(action, held_keys):
+    """
+    Perform a single sequence action.
+
+    Args:
+        action (dict): Action dictionary containing the action type and parameters
+        held_keys (dict): Keys currently held by the sequence, updated in place
+
+    Returns:
+        bool: False if the sequence should stop, True otherwise
+    """
+    handler = _ACTION_HANDLERS.get(action['type'])
+    if handler is None:
+        return True
+    return handler(action, held_keys)
 
 
 def perform_sequence(actions):
     """
     Perform a sequence of actions.
 
+    An action may list other actions under 'parallel_with'; those run as a
+    separate sequence on a background thread while the action itself runs,
+    and the sequence continues once both have finished.
+
     Args:
-        actions (list): List of action dictionaries, each containing the action type and parameters
+        actions (iterable): Action dictionaries, each containing the action type and parameters.
+            May be an iterator, in which case actions run as they are produced.
     """
     held_keys = {}  # Keep track of held keys
+    total = f"/{len(actions)}" if hasattr(actions, '__len__') else ""
+    pending_delay = 0
+    delay_deadline = 0
 
     for i, action in enumerate(actions):
-        print(f"Performing action {i+1}/{len(actions)}: {action['type']}")
+        # Wait between actions if the previous one asked for it, counting
+        # from when that action finished
+        if pending_delay > 0:
+            print(f"Waiting {pending_delay} seconds before next action...")
+            _sleep_until(delay_deadline)
+            pending_delay = 0
+
+        print(f"Performing action {i+1}{total}: {action['type']}")
 
         # Validate action parameters
         try:
@@ -784,93 +1339,25 @@ def perform_sequence(actions):
             print(f"Error in action {i+1}: {e}")
             continue
 
-        if action['type'] == 'window':
-            # Handle window selection
-            window_found = find_and_activate_window(
-                title=action.get('title'),
-                process=action.get('process'),
-                wait=action.get('wait', 1.0),
-                required=not action.get('not_required', False),
-                retry_count=action.get('retry_count', 3)
-            )
-            if not window_found and not action.get('not_required', False):
-                print("Stopping sequence due to window not found")
-                break
+        # Start any actions that should run alongside this one
+        parallel = None
+        if action.get('parallel_with'):
+            parallel = threading.Thread(
+                target=perform_sequence, args=(action['parallel_with'],))
+            parallel.start()
 
-        elif action['type'] == 'hold_key':
-            key = action.get('key')
-            if key:
-                held_keys[key] = hold_key(key)
-                print(f"Holding {key} key...")
-
-        elif action['type'] == 'release_key':
-            key = action.get('key')
-            if key and key in held_keys:
-                release_key(held_keys[key])
-                del held_keys[key]
-                print(f"Released {key} key")
-            elif action.get('all', False):
-                # Release all held keys
-                for k, obj in held_keys.items():
-                    release_key(obj)
-                    print(f"Released {k} key")
-                held_keys.clear()
-
-        elif action['type'] == 'move':
-            move_mouse(
-                action['x'],
-                action['y'],
-                delay=action.get('delay', 0),
-                check_bounds=action.get('check_bounds', True),
-                smooth=action.get('smooth', False),
-                smooth_duration=action.get('smooth_duration', 1.0),
-                smooth_steps=action.get('smooth_steps', 100),
-                monitor_index=action.get('monitor_index')
-            )
-
-        elif action['type'] == 'click':
-            perform_click(
-                button=action.get('button', 'left'),
-                count=action.get('count', 1),
-                interval=action.get('interval', 0.1),
-                double=action.get('double', False),
-                delay_after=action.get('delay_after', 0)
-            )
-
-        elif action['type'] == 'scroll':
-            perform_scroll(
-                amount=action['amount'],
-                steps=action.get('steps', 10),
-                interval=action.get('interval', 0.01),
-                delay_after=action.get('delay_after', 0)
-            )
-
-        elif action['type'] == 'key':
-            perform_key_press(
-                action['key'],
-                modifiers=action.get('modifiers'),
-                count=action.get('count', 1),
-                interval=action.get('interval', 0.1),
-                delay_after=action.get('delay_after', 0)
-            )
-
-        elif action['type'] == 'type':
-            perform_type(
-                action['text'],
-                interval=action.get('interval', 0.05),
-                delay_after=action.get('delay_after', 0)
-            )
-
-        elif action['type'] == 'wait':
-            delay = action.get('seconds', 1.0)
-            print(f"Waiting {delay} seconds...")
-            time.sleep(delay)
-
-        # Wait between actions if specified
-        if i < len(actions) - 1 and action.get('delay_after_action', 0) > 0:
-            delay = action.get('delay_after_action')
-            print(f"Waiting {delay} seconds before next action...")
-            time.sleep(delay)
+        try:
+            keep_going = _perform_action(action, held_keys)
+        finally:
+            if parallel:
+                parallel.join()
+
+        if not keep_going:
+            break
+
+        # Only wait once another action follows
+        pending_delay = action.get('delay_after_action', 0)
+        delay_deadline = time.perf_counter() + pending_delay
 
     # Release any remaining held keys
     for k, obj in held_keys.items():
@@ -878,48 +1365,59 @@ def perform_sequence(actions):
         print(f"Released {k} key")
 
 
+# Parameters each sequence action type must have
+_REQUIRED_ACTION_PARAMS = {
+    'move': ('x', 'y'),
+    'click': (),  # click has no required params, all have defaults
+    'key': ('key',),
+    'type': ('text',),
+    'scroll': ('amount',),
+    # at least one of these must be present
+    'window': ('title', 'process'),
+    'wait': ('seconds',)
+}
+
+
 def validate_sequence_action(action):
     """Validate a sequence action has all required parameters."""
-    required_params = {
-        'move': ['x', 'y'],
-        'click': [],  # click has no required params, all have defaults
-        'key': ['key'],
-        'type': ['text'],
-        'scroll': ['amount'],
-        # at least one of these must be present
-        'window': ['title', 'process'],
-        'wait': ['seconds']
-    }
+    action_type = action['type']
+    required = _REQUIRED_ACTION_PARAMS.get(action_type)
 
-    if action['type'] not in required_params:
-        raise ValueError(f"Unknown action type: {action['type']}")
+    if required is None:
+        raise ValueError(f"Unknown action type: {action_type}")
 
-    if action['type'] == 'window':
+    if action_type == 'window':
         # Special case: window requires at least one of title or process
         if not action.get('title') and not action.get('process'):
             raise ValueError(
                 "Window action requires either 'title' or 'process'")
         return
 
-    missing = [p for p in required_params[action['type']]
-               if p not in action]
+    missing = [p for p in required if p not in action]
     if missing:
         raise ValueError(
-            f"Missing required parameters for {action['type']}: {missing}")
+            f"Missing required parameters for {action_type}: {missing}")
 
 
 def record_events(output_file, duration=None):
     """
     Record mouse and keyboard events and save them to a JSON file.
 
+    Events are written to the file as they are recorded, one per line, so
+    long recordings don't build up in memory. The duration and event count
+    follow the action list once recording stops.
+
     Args:
         output_file (str): Path to save the recorded events
         duration (float): How long to record in seconds (default: indefinite)
     """
-    events = []
+    from pynput.mouse import Button, Listener as MouseListener
+    from pynput.keyboard import Key, KeyCode, Listener as KeyboardListener
+
     start_time = time.time()
-    mouse = MouseController()
-    recording = True
+    mouse = _mouse()
+    active = threading.Event()  # Cleared once recording stops
+    active.set()
     last_position = mouse.position
     event_count = 0
     held_keys = set()  # Track currently held keys
@@ -927,11 +1425,63 @@ def record_events(output_file, duration=None):
     WINDOW_CHECK_INTERVAL = 0.1  # Only check window every 100ms
     last_window = None
     MOVEMENT_THRESHOLD = 10  # Minimum pixel distance for recording movement
+    MOVEMENT_THRESHOLD_SQUARED = MOVEMENT_THRESHOLD * MOVEMENT_THRESHOLD
     MIN_MOVEMENT_DELAY = 0.05  # Minimum delay between recorded movements
+    STATUS_INTERVAL = 0.2  # How often the status line is refreshed
+    stop_requested = threading.Event()  # Set when Esc is pressed
+    # Template and arguments describing the last recorded event; callbacks only
+    # store them and the main thread formats the status line
+    last_event = [None]
+
+    # Type and time of the last saved event, for delays and move throttling
+    last_event_type = None
+    last_event_time = None
+    # Latest (x, y, time) the move throttle held back, saved before the next
+    # non-move event so clicks and keys replay where the cursor really was
+    pending_move = None
+    save_lock = threading.Lock()  # Listeners save events from their own threads
+
+    f = open(output_file, 'wb')
+    f.write(b'{\n  "version": "1.0",\n  "recorded_at": ' +
+            _json_dumps(time.strftime('%Y-%m-%d %H:%M:%S')) +
+            b',\n  "repeat": 1,\n  "actions": [')
+
+    def write_event(event, event_time):
+        """Write an event with its delay since the previous one (hold save_lock)."""
+        nonlocal last_event_type, last_event_time
+        first = last_event_time is None
+        event['delay'] = 0 if first else event_time - last_event_time
+        f.write((b'\n    ' if first else b',\n    ') + _json_dumps(event))
+        last_event_type = event['type']
+        last_event_time = event_time
+
+    def flush_pending_move():
+        """Write the move held back by the throttle, if any (hold save_lock)."""
+        nonlocal pending_move, last_position, event_count
+        if pending_move is None:
+            return
+        x, y, move_time = pending_move
+        pending_move = None
+        write_event({
+            "type": "move",
+            "x": x,
+            "y": y,
+            "smooth": True
+        }, move_time)
+        last_position = (x, y)
+        event_count += 1
+
+    def save_event(event, event_time):
+        """Write a non-move event, preceded by any held-back move."""
+        with save_lock:
+            if f.closed:  # A late callback after recording stopped
+                return
+            flush_pending_move()
+            write_event(event, event_time)
 
     def get_active_window():
         """Get current active window information."""
-        system = platform.system()
+        system = _SYSTEM
         if system == "Linux":
             try:
                 output = subprocess.check_output(
@@ -981,7 +1531,7 @@ def record_events(output_file, duration=None):
                 Write-Output "$($process.ProcessName)|$windowTitle"
                 '''
                 output = subprocess.check_output(
-                    ['powershell', '-Command', script], text=True).strip()
+                    _POWERSHELL + [script], text=True).strip()
                 process_name, window_title = output.split('|')
                 return {'process': process_name, 'title': window_title}
             except (subprocess.SubprocessError, FileNotFoundError):
@@ -1003,85 +1553,84 @@ def record_events(output_file, duration=None):
         if current_window and (last_window is None or
                                any(current_window[k] != last_window[k] for k in current_window)):
             last_window = current_window
-            events.append({
+            save_event({
                 "type": "window",
-                "time": current_time - start_time,
                 **current_window
-            })
+            }, current_time - start_time)
             event_count += 1
-            print(
-                f"\rRecorded events: {event_count} | Last event: Window changed to {current_window.get('title', '')}", end="")
+            last_event[0] = ("Window changed to {}", current_window.get('title', ''))
 
     # Get initial window
     last_window = get_active_window()
     if last_window:
-        events.append({
+        save_event({
             "type": "window",
-            "time": 0,
             **last_window
-        })
+        }, 0)
 
     def on_move(x, y):
-        if not recording:
+        if not active.is_set():
             return False
-        nonlocal last_position, event_count
+        nonlocal last_position, event_count, pending_move
         current_time = time.time() - start_time
 
-        # Calculate distance moved
-        dx = x - last_position[0]
-        dy = y - last_position[1]
-        distance = math.sqrt(dx*dx + dy*dy)
-
-        # Only record if position changed significantly and enough time has passed
-        if distance > MOVEMENT_THRESHOLD and (not events or
-                                              events[-1]['type'] != 'move' or
-                                              current_time - events[-1]['time'] >= MIN_MOVEMENT_DELAY):
-
-            events.append({
-                "type": "move",
-                "x": x,
-                "y": y,
-                "time": current_time,
-                "smooth": True
-            })
-            last_position = (x, y)
-            event_count += 1
-            print(
-                f"\rRecorded events: {event_count} | Last event: Mouse moved to ({x}, {y})", end="")
+        # Decide and write under the lock, so a click or key flushing the
+        # held-back move from another listener can't slip in between
+        with save_lock:
+            if f.closed:  # A late callback after recording stopped
+                return
+
+            # Compare squared distances to skip a square root per event
+            dx = x - last_position[0]
+            dy = y - last_position[1]
+
+            # Only record if position changed significantly and enough time has passed
+            if dx*dx + dy*dy > MOVEMENT_THRESHOLD_SQUARED and (last_event_type != 'move' or
+                                                  current_time - last_event_time >= MIN_MOVEMENT_DELAY):
+                pending_move = None
+                write_event({
+                    "type": "move",
+                    "x": x,
+                    "y": y,
+                    "smooth": True
+                }, current_time)
+                last_position = (x, y)
+                event_count += 1
+                last_event[0] = ("Mouse moved to ({}, {})", x, y)
+            else:
+                # Hold back the newest position, or nothing if the cursor
+                # came back to where the last saved move left it
+                pending_move = (x, y, current_time) if dx or dy else None
 
     def on_click(x, y, button, pressed):
-        if not recording:
+        if not active.is_set():
             return False
         nonlocal event_count
         current_time = time.time() - start_time
         if pressed:
             check_and_record_window_change()  # Check window on clicks
             btn_name = "left" if button == Button.left else "right"
-            events.append({
+            save_event({
                 "type": "click",
-                "button": btn_name,
-                "time": current_time
-            })
+                "button": btn_name
+            }, current_time)
             event_count += 1
-            print(
-                f"\rRecorded events: {event_count} | Last event: {btn_name.capitalize()} click at ({x}, {y})", end="")
+            last_event[0] = ("{} click at ({}, {})", btn_name.capitalize(), x, y)
 
     def on_scroll(x, y, dx, dy):
-        if not recording:
+        if not active.is_set():
             return False
         nonlocal event_count
         current_time = time.time() - start_time
         check_and_record_window_change()  # Check window on scroll
         amount = int(dy * 10)
         direction = "up" if amount > 0 else "down"
-        events.append({
+        save_event({
             "type": "scroll",
-            "amount": amount,
-            "time": current_time
-        })
+            "amount": amount
+        }, current_time)
         event_count += 1
-        print(
-            f"\rRecorded events: {event_count} | Last event: Scrolled {direction}", end="")
+        last_event[0] = ("Scrolled {}", direction)
 
     def get_key_name(key):
         """Convert key to a consistent string representation."""
@@ -1108,7 +1657,7 @@ def record_events(output_file, duration=None):
         return False
 
     def on_press(key):
-        if not recording:
+        if not active.is_set():
             return False
         nonlocal event_count
         current_time = time.time() - start_time
@@ -1117,6 +1666,7 @@ def record_events(output_file, duration=None):
         try:
             if key == Key.esc:
                 print("\nStopping recording...")
+                stop_requested.set()
                 return False  # Stop listener
         except AttributeError:
             pass
@@ -1128,27 +1678,23 @@ def record_events(output_file, duration=None):
             # Record modifier key press as hold_key event
             if key_name not in held_keys:
                 held_keys.add(key_name)
-                events.append({
+                save_event({
                     "type": "hold_key",
-                    "key": key_name,
-                    "time": current_time
-                })
+                    "key": key_name
+                }, current_time)
                 event_count += 1
-                print(
-                    f"\rRecorded events: {event_count} | Last event: Hold key '{key_name}'", end="")
+                last_event[0] = ("Hold key '{}'", key_name)
         else:
             # Regular key press
-            events.append({
+            save_event({
                 "type": "key",
-                "key": key_name,
-                "time": current_time
-            })
+                "key": key_name
+            }, current_time)
             event_count += 1
-            print(
-                f"\rRecorded events: {event_count} | Last event: Key press '{key_name}'", end="")
+            last_event[0] = ("Key press '{}'", key_name)
 
     def on_release(key):
-        if not recording:
+        if not active.is_set():
             return False
         nonlocal event_count
         current_time = time.time() - start_time
@@ -1159,14 +1705,19 @@ def record_events(output_file, duration=None):
         if is_modifier_key(key) and key_name in held_keys:
             # Record modifier key release
             held_keys.remove(key_name)
-            events.append({
+            save_event({
                 "type": "release_key",
-                "key": key_name,
-                "time": current_time
-            })
+                "key": key_name
+            }, current_time)
             event_count += 1
+            last_event[0] = ("Release key '{}'", key_name)
+
+    def show_status():
+        """Print the status line for the last recorded event."""
+        event = last_event[0]
+        if event is not None:
             print(
-                f"\rRecorded events: {event_count} | Last event: Release key '{key_name}'", end="")
+                f"\rRecorded events: {event_count} | Last event: {event[0].format(*event[1:])}", end="")
 
     # Start listeners
     print("\nRecording mouse and keyboard events. Press Esc to stop.")
@@ -1178,49 +1729,44 @@ def record_events(output_file, duration=None):
             KeyboardListener(on_press=on_press, on_release=on_release) as kb_listener:
 
         try:
-            while recording:
-                current_time = time.time() - start_time
-                if duration is not None and current_time >= duration:
-                    print("\nRecording duration reached.")
-                    break
-                time.sleep(0.01)  # Reduce CPU usage
-
-                if not mouse_listener.running or not kb_listener.running:
+            # Block until Esc is pressed or the duration runs out, waking up
+            # now and then to refresh the status line and to notice listeners
+            # that stopped on their own
+            shown = None
+            while mouse_listener.running and kb_listener.running:
+                if last_event[0] is not shown:
+                    shown = last_event[0]
+                    show_status()
+                timeout = STATUS_INTERVAL
+                if duration is not None:
+                    remaining = duration - (time.time() - start_time)
+                    if remaining <= 0:
+                        print("\nRecording duration reached.")
+                        break
+                    timeout = min(timeout, remaining)
+                if stop_requested.wait(timeout):
                     break
 
         except KeyboardInterrupt:
             print("\nRecording interrupted by user.")
-            recording = False
 
         finally:
             # Calculate total duration
             end_time = time.time() - start_time
 
-            # Stop listeners
+            # Make callbacks still in flight drop their events, then stop
+            # the listeners
+            active.clear()
             mouse_listener.stop()
             kb_listener.stop()
 
-            # Add timing information
-            for i in range(1, len(events)):
-                events[i]['delay'] = events[i]['time'] - events[i-1]['time']
-            if events:
-                events[0]['delay'] = 0
-
-            # Remove absolute timestamps
-            for event in events:
-                del event['time']
-
-            # Save to file
-            with open(output_file, 'w') as f:
-                # Save as a structured format that includes metadata
-                json.dump({
-                    'version': '1.0',
-                    'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'duration': end_time,
-                    'total_events': event_count,
-                    'repeat': 1,  # Default repeat count
-                    'actions': events
-                }, f, indent=2)
+            # Close the action list and finish the file with the metadata
+            # only known now
+            with save_lock:
+                flush_pending_move()
+                f.write(b'\n  ],\n  "duration": ' + _json_dumps(end_time) +
+                        b',\n  "total_events": ' + _json_dumps(event_count) + b'\n}\n')
+                f.close()
 
             print("\n" + "=" * 50)
             print("Recording summary:")
@@ -1229,6 +1775,91 @@ def record_events(output_file, duration=None):
             print("=" * 50)
 
 
+def _replay_window(event, held_keys):
+    """Activate the window of a recorded window event, by process then title."""
+    window_found = False
+    if 'process' in event:
+        print(f"Activating window for process: {event['process']}")
+        window_found = find_and_activate_window(
+            process=event['process'], wait=1, required=False)
+    if not window_found and 'title' in event:
+        print(f"Activating window with title: {event['title']}")
+        window_found = find_and_activate_window(
+            title=event['title'], wait=1, required=False)
+    if window_found:
+        print(
+            f"Successfully activated window: {event.get('title', event.get('process', 'Unknown'))}")
+    else:
+        print(
+            f"Warning: Could not find window: {event.get('title', event.get('process', 'Unknown'))}")
+
+
+def _replay_hold_key(event, held_keys):
+    """Hold the key of a recorded hold_key event."""
+    key = event.get('key')
+    if key:
+        held_keys[key] = hold_key(key)
+        print(f"Holding {key} key...")
+
+
+def _replay_release_key(event, held_keys):
+    """Release the key of a recorded release_key event if it is held."""
+    key = event.get('key')
+    if key and key in held_keys:
+        release_key(held_keys.pop(key))
+        print(f"Released {key} key")
+
+
+def _replay_move(event, held_keys):
+    """Move the mouse to the position of a recorded move event."""
+    move_mouse(
+        event['x'],
+        event['y'],
+        smooth=event.get('smooth', False),
+        smooth_duration=0.001  # Faster smooth movement
+    )
+
+
+def _replay_click(event, held_keys):
+    """Repeat a recorded click."""
+    perform_click(
+        button=event.get('button', 'left'),
+        count=event.get('count', 1)
+    )
+
+
+def _replay_scroll(event, held_keys):
+    """Repeat a recorded scroll."""
+    # Recorded scrolls are single wheel events; replay them as one scroll
+    # rather than ten spaced-out steps
+    perform_scroll(
+        amount=event['amount'],
+        steps=1
+    )
+
+
+def _replay_key(event, held_keys):
+    """Repeat a recorded key press."""
+    perform_key_press(
+        event['key']
+    )
+
+
+# Handler for each recorded event type; unknown types are skipped
+_REPLAY_HANDLERS = {
+    'window': _replay_window,
+    'hold_key': _replay_hold_key,
+    'release_key': _replay_release_key,
+    'move': _replay_move,
+    'click': _replay_click,
+    'scroll': _replay_scroll,
+    'key': _replay_key
+}
+
+# Replay prints its progress every this many events, and on the last one
+_REPLAY_PROGRESS_INTERVAL = 256
+
+
 def replay_events(input_file, override_repeat=None):
     """
     Replay recorded events from a JSON file.
@@ -1238,8 +1869,8 @@ def replay_events(input_file, override_repeat=None):
         override_repeat (int): Optional repeat count to override the file's repeat count
     """
     try:
-        with open(input_file, 'r') as f:
-            data = json.load(f)
+        with open(input_file, 'rb') as f:
+            data = _json_loads(f.read())
 
         # Handle both old format (list) and new format (object with metadata)
         if isinstance(data, list):
@@ -1269,13 +1900,23 @@ def replay_events(input_file, override_repeat=None):
 
             # Keep track of held keys
             held_keys = {}
-            current_window = None
 
             # Optimize delays for smoother playback
             MAX_MOVEMENT_DELAY = 0.05  # Cap movement delays
             CLICK_DELAY_FACTOR = 0.5   # Reduce click delays
             KEY_DELAY_FACTOR = 0.75    # Reduce key press delays
 
+            # Wait for each event's deadline from the start of the repetition
+            # rather than sleeping each delay, so oversleeps and the time
+            # spent performing events don't add up over a long recording
+            start = time.perf_counter()
+            scheduled = 0.0
+
+            # Bind loop lookups to locals
+            get_handler = _REPLAY_HANDLERS.get
+            sleep_until = _sleep_until
+            total = len(events)
+
             for i, event in enumerate(events, 1):
                 # Get and adjust the delay based on event type
                 delay = event.get('delay', 0)
@@ -1287,70 +1928,21 @@ def replay_events(input_file, override_repeat=None):
                 elif event['type'] == 'key':
                     delay *= KEY_DELAY_FACTOR
 
-                # Wait the adjusted delay before any action
+                # Wait out the adjusted delay before any action
                 if delay > 0:
-                    time.sleep(delay)
-
-                print(f"Event {i}/{len(events)}: {event['type']}")
-
-                if event['type'] == 'window':
-                    # Try to find and activate the window
-                    window_found = False
-                    if 'process' in event:
-                        print(
-                            f"Activating window for process: {event['process']}")
-                        window_found = find_and_activate_window(
-                            process=event['process'], wait=1, required=False)
-                    if not window_found and 'title' in event:
-                        print(
-                            f"Activating window with title: {event['title']}")
-                        window_found = find_and_activate_window(
-                            title=event['title'], wait=1, required=False)
-                    if window_found:
-                        current_window = event
-                        print(
-                            f"Successfully activated window: {event.get('title', event.get('process', 'Unknown'))}")
-                    else:
-                        print(
-                            f"Warning: Could not find window: {event.get('title', event.get('process', 'Unknown'))}")
-
-                elif event['type'] == 'hold_key':
-                    key = event.get('key')
-                    if key:
-                        held_keys[key] = hold_key(key)
-                        print(f"Holding {key} key...")
-
-                elif event['type'] == 'release_key':
-                    key = event.get('key')
-                    if key and key in held_keys:
-                        release_key(held_keys[key])
-                        del held_keys[key]
-                        print(f"Released {key} key")
-
-                elif event['type'] == 'move':
-                    move_mouse(
-                        event['x'],
-                        event['y'],
-                        smooth=event.get('smooth', False),
-                        smooth_duration=0.001  # Faster smooth movement
-                    )
-                elif event['type'] == 'click':
-                    perform_click(
-                        button=event.get('button', 'left'),
-                        count=event.get('count', 1)
-                    )
-                elif event['type'] == 'scroll':
-                    perform_scroll(
-                        amount=event['amount']
-                    )
-                elif event['type'] == 'key':
-                    perform_key_press(
-                        event['key']
-                    )
+                    scheduled += delay
+                    sleep_until(start + scheduled)
 
-                if rep < repeat_count - 1:
-                    print("\nWaiting 1 second before next repetition...")
-                    time.sleep(1)
+                if i % _REPLAY_PROGRESS_INTERVAL == 0 or i == total:
+                    print(f"Event {i}/{total}: {event['type']}")
+
+                handler = get_handler(event['type'])
+                if handler is not None:
+                    handler(event, held_keys)
+
+            if rep < repeat_count - 1:
+                print("\nWaiting 1 second before next repetition...")
+                time.sleep(1)
 
     except KeyboardInterrupt:
         print("\nReplay stopped by user.")
@@ -1363,7 +1955,8 @@ def replay_events(input_file, override_repeat=None):
     print("\nReplay complete.")
 
 
-def move_mouse(x, y, delay=0, check_bounds=True, smooth=False, smooth_duration=1.0, smooth_steps=100, monitor_index=None):
+def move_mouse(x, y, delay=0, check_bounds=True, smooth=False, smooth_duration=1.0, smooth_steps=100, monitor_index=None,
+               bounds_policy=None):
     """
     Move the mouse to specified coordinates with various options.
 
@@ -1371,16 +1964,67 @@ def move_mouse(x, y, delay=0, check_bounds=True, smooth=False, smooth_duration=1
         x (int): X coordinate
         y (int): Y coordinate
         delay (float): Delay before moving in seconds
-        check_bounds (bool): Whether to check screen boundaries
+        check_bounds (bool): Whether to check screen boundaries when a
+            bounds_policy is given
         smooth (bool): Whether to move smoothly
         smooth_duration (float): Duration of smooth movement in seconds
         smooth_steps (int): Number of steps in smooth movement
         monitor_index (int): Index of monitor to use for coordinates
+        bounds_policy (str): What to do with out-of-bounds coordinates:
+            'warn' (move anyway), 'clamp' (move to the nearest monitor edge),
+            'skip' (don't move) or 'raise' (raise ValueError). None (the
+            default) skips the check, which needs a monitor query.
+
+    Raises:
+        ValueError: If the coordinates are out of bounds and bounds_policy is 'raise'
     """
-    mouse = MouseController()
+    mouse = _mouse()
+
+    # Check screen boundaries only when a policy asks for it, skipping the
+    # monitor query for coordinates that are obviously on screen
+    needs_bounds = check_bounds and bounds_policy is not None and not (
+        0 <= x < _SAFE_SCREEN_WIDTH and 0 <= y < _SAFE_SCREEN_HEIGHT)
 
     if delay > 0:
+        # Detect the monitor layout in the background during the delay
+        prefetch = None
+        if needs_bounds and monitor_index is None:
+            prefetch = threading.Thread(target=_desktop_rects, daemon=True)
+            prefetch.start()
         time.sleep(delay)
+        if prefetch:
+            prefetch.join()
+
+    if needs_bounds:
+        # Coordinates relative to a monitor must fit that monitor; global
+        # ones may land on any monitor of the desktop
+        monitor = get_monitor_by_index(monitor_index) if monitor_index is not None else None
+        if monitor:
+            rects = ((0, 0, monitor['width'], monitor['height']),)
+        else:
+            rects = _desktop_rects()
+        # Without a detected layout there is nothing to check against
+        if rects and not any(left <= x < right and top <= y < bottom
+                   for left, top, right, bottom in rects):
+            bounds = ", ".join(f"{right - left}x{bottom - top}+{left}+{top}"
+                               for left, top, right, bottom in rects)
+            message = (f"Coordinates ({x}, {y}) are outside the screen "
+                       f"bounds ({bounds})")
+            if bounds_policy == 'raise':
+                raise ValueError(message)
+            if bounds_policy == 'skip':
+                print(f"Skipping move: {message}")
+                return
+            if bounds_policy == 'clamp':
+                # Move to the closest point of the nearest monitor, so gaps
+                # between monitors of different sizes are never targeted
+                x, y = min(
+                    ((max(left, min(x, right - 1)), max(top, min(y, bottom - 1)))
+                     for left, top, right, bottom in rects),
+                    key=lambda point: (point[0] - x) ** 2 + (point[1] - y) ** 2)
+                print(f"Warning: {message}, moving to ({x}, {y})")
+            else:
+                print(f"Warning: {message}")
 
     # Convert coordinates if monitor specified
     if monitor_index is not None:
@@ -1393,7 +2037,7 @@ def move_mouse(x, y, delay=0, check_bounds=True, smooth=False, smooth_duration=1
     if smooth:
         smooth_move(start_x, start_y, x, y, smooth_duration, smooth_steps)
     else:
-        mouse.position = (x, y)
+        _set_position(x, y)
 
 
 def perform_click(button='left', count=1, interval=0.1, double=False, delay_after=0):
@@ -1407,18 +2051,22 @@ def perform_click(button='left', count=1, interval=0.1, double=False, delay_afte
         double (bool): Whether to perform a double-click
         delay_after (float): Delay after clicking
     """
-    mouse = MouseController()
-    btn = Button.left if button == 'left' else Button.right
+    buttons = _button_map()
+    btn = buttons.get(button, buttons['right'])
 
     if double:
         count = 2
         interval = 0.1  # Standard double-click interval
 
-    for _ in range(count):
-        mouse.press(btn)
-        mouse.release(btn)
-        if _ < count - 1:  # Don't sleep after last click
-            time.sleep(interval)
+    if interval <= 0:
+        _click_burst(btn, count)
+    else:
+        # Click on a fixed schedule so sleep overshoot doesn't accumulate
+        start = time.perf_counter()
+        for i in range(count):
+            if i:  # Don't wait before the first click
+                _sleep_until(start + i * interval)
+            _click_button(btn)
 
     if delay_after > 0:
         time.sleep(delay_after)
@@ -1430,16 +2078,20 @@ def perform_scroll(amount, steps=10, interval=0.01, delay_after=0):
 
     Args:
         amount (int): Amount to scroll (positive for up, negative for down)
-        steps (int): Number of steps to divide the scroll into
+        steps (int): Number of steps to divide the scroll into; 1 or less
+            scrolls the whole amount at once without waiting
         interval (float): Interval between scroll steps
         delay_after (float): Delay after scrolling
     """
-    mouse = MouseController()
-    step_amount = amount / steps
+    mouse = _mouse()
 
-    for _ in range(steps):
-        mouse.scroll(0, step_amount)
-        time.sleep(interval)
+    if steps <= 1:
+        mouse.scroll(0, amount)
+    else:
+        step_amount = amount / steps
+        for _ in range(steps):
+            mouse.scroll(0, step_amount)
+            time.sleep(interval)
 
     if delay_after > 0:
         time.sleep(delay_after)
@@ -1455,12 +2107,9 @@ def hold_multiple_keys(keys):
     Returns:
         dict: Dictionary mapping key names to their key objects
     """
-    # Define the order of modifier keys
-    key_order = ['ctrl', 'alt', 'shift', 'cmd', 'win', 'windows']
-
     # Sort keys based on the defined order
-    sorted_keys = sorted(keys, key=lambda k: key_order.index(
-        k.lower()) if k.lower() in key_order else len(key_order))
+    sorted_keys = sorted(keys, key=lambda k: _MODIFIER_ORDER.index(
+        k.lower()) if k.lower() in _MODIFIER_ORDER else len(_MODIFIER_ORDER))
 
     held_keys = {}
     for key in sorted_keys:
@@ -1494,17 +2143,15 @@ def perform_key_press(key, modifiers=None, count=1, interval=0.1, delay_after=0)
         interval (float): Interval between key presses
         delay_after (float): Delay after key press
     """
-    keyboard = KeyboardController()
+    keyboard = _keyboard()
     held_keys = {}
 
     # Convert string key to Key object if it's a special key
-    if hasattr(Key, key):
-        key = getattr(Key, key)
-    elif len(key) == 1:
-        key = key
-    else:
+    resolved = _resolve_key(key)
+    if resolved is None:
         print(f"Warning: Unknown key '{key}'")
         return
+    key = resolved
 
     try:
         # Handle modifiers
@@ -1536,12 +2183,19 @@ def perform_type(text, interval=0.05, delay_after=0):
         interval (float): Interval between keystrokes
         delay_after (float): Delay after typing
     """
-    keyboard = KeyboardController()
+    keyboard = _keyboard()
 
-    for char in text:
-        keyboard.press(char)
-        keyboard.release(char)
-        time.sleep(interval)
+    if interval <= 0:
+        # Let pynput send the whole string in one call
+        keyboard.type(text)
+    else:
+        # Bind hot-loop callables to locals to avoid repeated attribute lookups
+        type_text = keyboard.type
+        sleep = time.sleep
+        for char in text:
+            # type() also handles shift state for characters like uppercase letters
+            type_text(char)
+            sleep(interval)
 
     if delay_after > 0:
         time.sleep(delay_after)
@@ -1557,25 +2211,13 @@ def hold_key(key):
     Returns:
         Key: Key object that was held down, or None if invalid key
     """
-    keyboard = KeyboardController()
-
-    # Map key names to Key objects
-    key_map = {
-        'cmd': Key.cmd,
-        'command': Key.cmd,
-        'win': Key.cmd,
-        'windows': Key.cmd,
-        'ctrl': Key.ctrl,
-        'control': Key.ctrl,
-        'alt': Key.alt,
-        'shift': Key.shift
-    }
+    keyboard = _keyboard()
 
     # Convert key name to lowercase for case-insensitive matching
-    key_lower = key.lower()
+    key_name = _MODIFIER_KEY_MAP.get(key.lower())
 
-    if key_lower in key_map:
-        key_obj = key_map[key_lower]
+    if key_name is not None:
+        key_obj = _key_map()[key_name]
         keyboard.press(key_obj)
         return key_obj
     else:
@@ -1591,10 +2233,137 @@ def release_key(key_obj):
         key_obj: Key object to release
     """
     if key_obj is not None:
-        keyboard = KeyboardController()
+        keyboard = _keyboard()
         keyboard.release(key_obj)
 
 
+def _parse_move(params):
+    """Parse 'move X Y [--smooth] [--clamp|--skip-oob]'."""
+    if len(params) >= 2:
+        action = {
+            'type': 'move',
+            'x': int(params[0]),
+            'y': int(params[1]),
+            'smooth': '--smooth' in params
+        }
+        if '--clamp' in params:
+            action['bounds_policy'] = 'clamp'
+        elif '--skip-oob' in params:
+            action['bounds_policy'] = 'skip'
+        return [action]
+    return []
+
+
+def _parse_click(params):
+    """Parse 'click [left|right] [COUNT]'."""
+    return [{
+        'type': 'click',
+        'button': params[0] if params and params[0] in ['left', 'right'] else 'left',
+        'count': int(params[1]) if len(params) > 1 else 1
+    }]
+
+
+def _parse_key(params):
+    """Parse 'key KEY [MODIFIER...]'."""
+    if not params:
+        return []
+    action = {
+        'type': 'key',
+        'key': params[0]
+    }
+    # Check for modifiers
+    if len(params) > 1:
+        action['modifiers'] = [mod for mod in params[1:] if mod in _MODIFIER_KEY_MAP]
+    return [action]
+
+
+def _parse_wait(params):
+    """Parse 'wait SECONDS'."""
+    if params:
+        return [{
+            'type': 'wait',
+            'seconds': float(params[0])
+        }]
+    return []
+
+
+def _parse_drag(params):
+    """Parse 'drag X Y'."""
+    if len(params) >= 2:
+        return [{
+            'type': 'move',
+            'x': int(params[0]),
+            'y': int(params[1]),
+            'drag': True
+        }]
+    return []
+
+
+def _parse_drag_from(params):
+    """Parse 'drag_from X1 Y1 X2 Y2'."""
+    if len(params) >= 4:
+        return [{
+            'type': 'move',
+            'x': int(params[0]),
+            'y': int(params[1])
+        }, {
+            'type': 'move',
+            'x': int(params[2]),
+            'y': int(params[3]),
+            'drag': True
+        }]
+    return []
+
+
+def _parse_type(params):
+    """Parse 'type TEXT [--interval SECONDS]'."""
+    if not params:
+        return []
+    action = {
+        'type': 'type',
+        'text': params[0]
+    }
+    # Check for interval parameter
+    for i, param in enumerate(params):
+        if param == '--interval' and i + 1 < len(params):
+            action['interval'] = float(params[i + 1])
+    return [action]
+
+
+def _parse_scroll(params):
+    """Parse 'scroll AMOUNT [--steps COUNT] [--interval SECONDS]'."""
+    if not params:
+        return []
+    action = {
+        'type': 'scroll',
+        'amount': int(params[0])
+    }
+    # Check for additional parameters
+    for i, param in enumerate(params):
+        if param == '--steps' and i + 1 < len(params):
+            action['steps'] = int(params[i + 1])
+        elif param == '--interval' and i + 1 < len(params):
+            action['interval'] = float(params[i + 1])
+    return [action]
+
+
+# Simple sequence command parsers, keyed by command name
+_SIMPLE_ACTION_PARSERS = {
+    'move': _parse_move,
+    'click': _parse_click,
+    'key': _parse_key,
+    'wait': _parse_wait,
+    'drag': _parse_drag,
+    'drag_from': _parse_drag_from,
+    'type': _parse_type,
+    'scroll': _parse_scroll,
+}
+
+
+# One non-blank command between semicolons; blank commands never match
+_COMMAND_RE = re.compile(r'[^;\s][^;]*')
+
+
 def parse_simple_sequence(sequence_str):
     """
     Parse a simple sequence string into a list of action dictionaries.
@@ -1606,20 +2375,21 @@ def parse_simple_sequence(sequence_str):
         list: List of action dictionaries
     """
     actions = []
-    commands = [cmd.strip() for cmd in sequence_str.split(';')]
 
-    for cmd in commands:
-        if not cmd:
-            continue
+    # Only use shlex when there are quotes or escapes to handle
+    needs_shlex = any(c in sequence_str for c in '\'"\\')
 
-        parts = shlex.split(cmd)  # Properly handle quoted strings
+    for match in _COMMAND_RE.finditer(sequence_str):
+        cmd = match.group()
+        parts = shlex.split(cmd) if needs_shlex else cmd.split()
         action_type = parts[0].lower()
         params = parts[1:]
 
-        # Handle repeat parameter for any action
+        # Handle repeat parameter for any action; most commands have none,
+        # so check for it before scanning parameter by parameter
         repeat_count = 1
         repeat_index = -1
-        for i, param in enumerate(params):
+        for i, param in enumerate(params if '--repeat' in params else ()):
             if param == '--repeat' and i + 1 < len(params):
                 try:
                     repeat_count = int(params[i + 1])
@@ -1633,99 +2403,21 @@ def parse_simple_sequence(sequence_str):
         if repeat_index >= 0:
             params = params[:repeat_index] + params[repeat_index + 2:]
 
-        base_action = None
-
-        if action_type == 'move':
-            if len(params) >= 2:
-                base_action = {
-                    'type': 'move',
-                    'x': int(params[0]),
-                    'y': int(params[1]),
-                    'smooth': '--smooth' in params
-                }
-
-        elif action_type == 'click':
-            base_action = {
-                'type': 'click',
-                'button': params[0] if params and params[0] in ['left', 'right'] else 'left',
-                'count': int(params[1]) if len(params) > 1 else 1
-            }
+        parser = _SIMPLE_ACTION_PARSERS.get(action_type)
+        if parser is None:
+            print(f"Warning: Unknown action '{action_type}'")
+            continue
 
-        elif action_type == 'key':
-            if params:
-                base_action = {
-                    'type': 'key',
-                    'key': params[0]
-                }
-                # Check for modifiers
-                if len(params) > 1:
-                    base_action['modifiers'] = [mod for mod in params[1:] if mod in
-                                                ['ctrl', 'control', 'alt', 'shift', 'cmd', 'command', 'win', 'windows']]
-
-        elif action_type == 'wait':
-            if params:
-                base_action = {
-                    'type': 'wait',
-                    'seconds': float(params[0])
-                }
-
-        elif action_type == 'drag':
-            if len(params) >= 2:
-                base_action = {
-                    'type': 'move',
-                    'x': int(params[0]),
-                    'y': int(params[1]),
-                    'drag': True
-                }
-
-        elif action_type == 'drag_from':
-            if len(params) >= 4:
-                actions.extend([{
-                    'type': 'move',
-                    'x': int(params[0]),
-                    'y': int(params[1])
-                }] * repeat_count)
-                base_action = {
-                    'type': 'move',
-                    'x': int(params[2]),
-                    'y': int(params[3]),
-                    'drag': True
-                }
-
-        elif action_type == 'type':
-            if params:
-                base_action = {
-                    'type': 'type',
-                    'text': params[0]
-                }
-                # Check for interval parameter
-                for i, param in enumerate(params):
-                    if param == '--interval' and i + 1 < len(params):
-                        base_action['interval'] = float(params[i + 1])
-
-        elif action_type == 'scroll':
-            if params:
-                base_action = {
-                    'type': 'scroll',
-                    'amount': int(params[0])
-                }
-                # Check for additional parameters
-                for i, param in enumerate(params):
-                    if param == '--steps' and i + 1 < len(params):
-                        base_action['steps'] = int(params[i + 1])
-                    elif param == '--interval' and i + 1 < len(params):
-                        base_action['interval'] = float(params[i + 1])
-
-        # Add the action repeat_count times if it was created
-        if base_action:
-            actions.extend([base_action] * repeat_count)
+        # Add each parsed action repeat_count times
+        for action in parser(params):
+            actions.extend([action] * repeat_count)
 
     return actions
 
 
 def list_windows():
     """List all available window titles."""
-    system = platform.system()
+    system = _SYSTEM
 
     if system == "Linux":
         try:
@@ -1800,7 +2492,7 @@ def list_windows():
             Get-Process | Where-Object {$_.MainWindowTitle} | Select-Object ProcessName, MainWindowTitle | Format-Table -AutoSize
             '''
             output = subprocess.check_output(
-                ['powershell', '-Command', script], text=True)
+                _POWERSHELL + [script], text=True)
 
             print("\nAvailable Windows:")
             print("=" * 80)
@@ -1813,6 +2505,77 @@ def list_windows():
         print(f"Window listing is not supported on {system}")
 
 
+def _iter_in_background(iterable, maxsize=16):
+    """
+    Yield the items of an iterable, producing them on a background thread.
+
+    The producer runs up to maxsize items ahead, so slow work between items
+    (such as parsing) overlaps with whatever the consumer does with them.
+
+    Args:
+        iterable (iterable): Items to produce
+        maxsize (int): Maximum number of items produced ahead
+
+    Yields:
+        The items of iterable, in order
+    """
+    items = queue.Queue(maxsize)
+    done = object()
+    errors = []
+
+    def produce():
+        try:
+            for item in iterable:
+                items.put(item)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            items.put(done)
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    while True:
+        item = items.get()
+        if item is done:
+            break
+        yield item
+
+    # Re-raise a production error in the consumer once the items run out
+    if errors:
+        raise errors[0]
+
+
+def _stream_sequence_file(path):
+    """
+    Perform the actions in a JSON array file as they are parsed.
+
+    Uses ijson when it is installed, so the first action runs before the
+    rest of the file is read and the whole list is never held in memory.
+
+    Args:
+        path (str): Path to the JSON sequence file
+
+    Returns:
+        bool: True if the sequence was performed, False if ijson is not
+            installed or the file does not hold a top-level array
+    """
+    try:
+        import ijson
+    except ImportError:
+        return False
+
+    with open(path, 'rb') as f:
+        if not f.read(4096).lstrip().startswith(b'['):
+            return False
+        f.seek(0)
+        # Ask the OS to read the rest of the file ahead while actions run
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        perform_sequence(_iter_in_background(
+            ijson.items(f, 'item', use_float=True)))
+    return True
+
+
 def repeat_sequence(sequence, repeat_count):
     """
     Repeat a sequence of actions multiple times.
@@ -1827,12 +2590,13 @@ def repeat_sequence(sequence, repeat_count):
         perform_sequence(sequence)
 
 
-def main():
-    """Parse command line arguments and execute the appropriate action."""
-    parser = argparse.ArgumentParser(
-        description='Move the mouse to specified coordinates and perform mouse actions.')
+# Repeat option shared by the movement and click groups
+_ACTION_REPEAT = {
+    'help': 'Number of times to repeat this action (default: 1)', 'type': int, 'default': 1}
+
 
-    # Record and Replay options
+def _add_record_options(parser):
+    """Add the record, replay and sequence options to parser."""
     record_group = parser.add_argument_group('Record and Replay options')
     record_group.add_argument('--record', nargs='?', const='recorded_actions.json', metavar='OUTPUT_FILE',
                               help='Record mouse and keyboard events to a file (default: recorded_actions.json)')
@@ -1845,7 +2609,9 @@ def main():
     record_group.add_argument('--sequence', type=str,
                               help='Execute a sequence of actions (simple syntax or JSON file)')
 
-    # Global options
+
+def _add_global_options(parser):
+    """Add the options that apply to every action to parser."""
     global_group = parser.add_argument_group('Global options')
     global_group.add_argument('--global-delay', type=float, default=0,
                               help='Default delay between all actions (default: 0)')
@@ -1864,15 +2630,13 @@ def main():
     global_group.add_argument('--wait', type=float,
                               help='Wait for specified number of seconds')
 
-    # Add repeat option to each action group
-    action_repeat = {
-        'help': 'Number of times to repeat this action (default: 1)', 'type': int, 'default': 1}
 
-    # Mouse movement options
+def _add_mouse_options(parser):
+    """Add the mouse movement options to parser."""
     mouse_group = parser.add_argument_group('Mouse movement options')
     mouse_group.add_argument('--move', nargs=2, type=int, metavar=('X', 'Y'),
                              help='Move mouse to specified X,Y coordinates')
-    mouse_group.add_argument('--move-repeat', **action_repeat)
+    mouse_group.add_argument('--move-repeat', **_ACTION_REPEAT)
     mouse_group.add_argument('--smooth', action='store_true',
                              help='Move mouse smoothly to target position')
     mouse_group.add_argument('--duration', type=float, default=1.0,
@@ -1883,10 +2647,15 @@ def main():
                              help='Delay before moving in seconds (default: 0)')
     mouse_group.add_argument('--monitor-index', type=int,
                              help='Index of monitor to use for coordinates')
-    mouse_group.add_argument('--ignore-bounds', action='store_true',
+    mouse_group.add_argument('--ignore-bounds', action='store_false', dest='check_bounds',
                              help='Ignore screen boundary checks')
+    mouse_group.add_argument('--bounds-policy', choices=['warn', 'clamp', 'skip', 'raise'],
+                             help='Check coordinates against the detected monitors and handle '
+                                  'out-of-bounds ones this way (default: no check)')
+
 
-    # Click options
+def _add_click_options(parser):
+    """Add the click options to parser."""
     click_group = parser.add_argument_group('Click options')
     click_group.add_argument('--click', action='store_true',
                              help='Perform a left click')
@@ -1901,22 +2670,26 @@ def main():
     click_group.add_argument('--click-delay', type=float, default=0,
                              help='Delay after clicking in seconds (default: 0)')
     click_group.add_argument(
-        '--click-repeat', **action_repeat)  # Add this line
+        '--click-repeat', **_ACTION_REPEAT)
+
 
-    # Drag options
+def _add_drag_options(parser):
+    """Add the drag options to parser."""
     drag_group = parser.add_argument_group('Drag options')
     drag_group.add_argument('--drag', nargs=2, type=int, metavar=('DX', 'DY'),
                             help='Drag to specified coordinates')
     drag_group.add_argument('--drag-from', nargs=4, type=int, metavar=('X1', 'Y1', 'X2', 'Y2'),
                             help='Drag from X1,Y1 to X2,Y2')
-    drag_group.add_argument('--no-drag-smooth', action='store_true',
+    drag_group.add_argument('--no-drag-smooth', action='store_false', dest='drag_smooth',
                             help='Disable smooth movement during drag')
     drag_group.add_argument('--click-before-drag', action='store_true',
                             help='Click before starting drag')
     drag_group.add_argument('--click-after-drag', action='store_true',
                             help='Click after completing drag')
 
-    # Key options
+
+def _add_key_options(parser):
+    """Add the key press and hold options to parser."""
     key_group = parser.add_argument_group('Key options')
     key_group.add_argument('--hold-key', choices=['cmd', 'ctrl', 'alt', 'shift'],
                            help='Hold down a modifier key')
@@ -1935,7 +2708,9 @@ def main():
     key_group.add_argument('--key-delay', type=float, default=0,
                            help='Delay after key press in seconds (default: 0)')
 
-    # Type options
+
+def _add_type_options(parser):
+    """Add the text typing options to parser."""
     type_group = parser.add_argument_group('Type options')
     type_group.add_argument('--type', type=str,
                             help='Type a sequence of text')
@@ -1944,7 +2719,9 @@ def main():
     type_group.add_argument('--type-delay', type=float, default=0,
                             help='Delay after typing in seconds (default: 0)')
 
-    # Scroll options
+
+def _add_scroll_options(parser):
+    """Add the scroll options to parser."""
     scroll_group = parser.add_argument_group('Scroll options')
     scroll_group.add_argument('--scroll', type=int,
                               help='Amount to scroll (positive for up, negative for down)')
@@ -1955,7 +2732,9 @@ def main():
     scroll_group.add_argument('--scroll-delay', type=float, default=0,
                               help='Delay after scrolling in seconds (default: 0)')
 
-    # Monitor options
+
+def _add_monitor_options(parser):
+    """Add the mouse and monitor listing options to parser."""
     monitor_group = parser.add_argument_group('Monitor options')
     monitor_group.add_argument('--monitor', action='store_true',
                                help='Monitor mouse position in real-time')
@@ -1963,12 +2742,14 @@ def main():
                                help='Update interval for monitoring in seconds (default: 0.1)')
     monitor_group.add_argument('--monitor-duration', type=float,
                                help='Duration to monitor in seconds (default: indefinite)')
-    monitor_group.add_argument('--no-monitor-clicks', action='store_true',
+    monitor_group.add_argument('--no-monitor-clicks', action='store_false', dest='monitor_clicks',
                                help='Disable click detection during monitoring')
     monitor_group.add_argument('--list-monitors', action='store_true',
                                help='List all detected monitors')
 
-    # Window selection options
+
+def _add_window_options(parser):
+    """Add the window selection options to parser."""
     window_group = parser.add_argument_group('Window selection options')
     window_group.add_argument('--list-windows', action='store_true',
                               help='List all available window titles')
@@ -1983,7 +2764,135 @@ def main():
     window_group.add_argument('--window-retry', type=int, default=3,
                               help='Number of times to retry finding window (default: 3)')
 
-    args = parser.parse_args()
+
+# Option groups in help order
+_ALL_OPTIONS = (
+    _add_record_options, _add_global_options, _add_mouse_options,
+    _add_click_options, _add_drag_options, _add_key_options,
+    _add_type_options, _add_scroll_options, _add_monitor_options,
+    _add_window_options
+)
+
+# Options main() reads before returning in each standalone mode
+_MODE_OPTIONS = {
+    '--list-monitors': (_add_monitor_options,),
+    '--monitor': (_add_monitor_options,),
+    '--record': (_add_record_options, _add_monitor_options),
+    '--replay': (_add_record_options, _add_monitor_options),
+    '--sequence': (_add_record_options, _add_global_options, _add_monitor_options)
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _build_parser(option_groups, **kwargs):
+    """
+    Build the command line parser with the given option groups.
+
+    Parsers are cached, so repeated calls to main() in one process only
+    build each of them once.
+
+    Args:
+        option_groups (tuple): Functions that each add one option group
+        **kwargs: Extra arguments for argparse.ArgumentParser
+
+    Returns:
+        argparse.ArgumentParser: The configured parser
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Move the mouse to specified coordinates and perform mouse actions.', **kwargs)
+    for add_options in option_groups:
+        add_options(parser)
+    return parser
+
+
+# Commands that need no argument parsing at all, by their exact argv
+_FAST_PATHS = {
+    ('--monitor',): lambda: monitor_mouse_position(),
+    ('--list-monitors',): lambda: list_monitors()
+}
+
+
+def _parse_fast_move(argv):
+    """
+    Parse a bare '--move X Y' without building a parser.
+
+    Scripts often call the tool in a loop just to move the mouse, so this
+    form skips argparse and produces the same action the parser would.
+
+    Args:
+        argv (list): Command line arguments, without the program name
+
+    Returns:
+        dict: The move action, or None if argv is anything else
+    """
+    if len(argv) != 3 or argv[0] != '--move':
+        return None
+    try:
+        x, y = int(argv[1]), int(argv[2])
+    except ValueError:
+        return None
+    return {
+        'type': 'move',
+        'x': x,
+        'y': y,
+        'delay': 0,
+        'check_bounds': True,
+        'smooth': False,
+        'smooth_duration': 1.0,
+        'smooth_steps': 100,
+        'monitor_index': None,
+        'bounds_policy': None
+    }
+
+
+def _parse_args(argv=None):
+    """
+    Parse command line arguments, building only the options needed.
+
+    Standalone modes such as --monitor only read a few options, so when
+    one is given the parser is built from just those groups. Anything
+    the reduced parser does not recognise, including abbreviated
+    options, is parsed again with the full parser.
+
+    Args:
+        argv (list): Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    flags = {arg.split('=', 1)[0] for arg in argv if arg.startswith('-')}
+    if not flags & {'-h', '--help'}:
+        option_groups = tuple(add_options for add_options in _ALL_OPTIONS
+                              if any(add_options in _MODE_OPTIONS[flag]
+                                     for flag in flags & _MODE_OPTIONS.keys()))
+        if option_groups:
+            parser = _build_parser(option_groups, allow_abbrev=False)
+            args, extra = parser.parse_known_args(argv)
+            if not extra:
+                return args
+
+    return _build_parser(_ALL_OPTIONS).parse_args(argv)
+
+
+def main():
+    """Parse command line arguments and execute the appropriate action."""
+    # Bare standalone modes run with their defaults without building a parser
+    fast_path = _FAST_PATHS.get(tuple(sys.argv[1:]))
+    if fast_path is not None:
+        fast_path()
+        return
+
+    move_action = _parse_fast_move(sys.argv[1:])
+    if move_action is not None:
+        perform_sequence([move_action])
+        return
+
+    args = _parse_args()
 
     # Add a flag to track if click was performed during move
     click_performed = False
@@ -1997,7 +2906,7 @@ def main():
     if args.monitor:
         monitor_mouse_position(
             update_interval=args.monitor_interval,
-            show_clicks=not args.no_monitor_clicks,
+            show_clicks=args.monitor_clicks,
             duration=args.monitor_duration
         )
         return
@@ -2014,20 +2923,27 @@ def main():
 
     # Handle sequence mode
     if args.sequence is not None:
-        if args.sequence.endswith('.json') and os.path.isfile(args.sequence):
-            with open(args.sequence, 'r') as f:
-                sequence_data = json.load(f)
-                # Handle both array and object formats
-                if isinstance(sequence_data, list):
-                    actions = sequence_data
-                else:
-                    actions = sequence_data.get('actions', [])
-                    # Apply sequence-level repeat if specified
-                    sequence_repeat = sequence_data.get('repeat', 1)
-                    args.global_repeat = max(
-                        sequence_repeat, args.global_repeat)
+        # Inline JSON and multi-line scripts never need the file system
+        # check; neither does anything longer than a path can be
+        if (args.sequence[:1] not in '[{' and args.sequence.endswith('.json')
+                and len(args.sequence) < 4096 and '\n' not in args.sequence
+                and os.path.isfile(args.sequence)):
+            # A single pass over a plain action list can run while parsing
+            if args.global_repeat <= 1 and _stream_sequence_file(args.sequence):
+                return
+            with open(args.sequence, 'rb') as f:
+                sequence_data = _json_loads(f.read())
+            # Handle both array and object formats
+            if isinstance(sequence_data, list):
+                actions = sequence_data
+            else:
+                actions = sequence_data.get('actions', [])
+                # Apply sequence-level repeat if specified
+                sequence_repeat = sequence_data.get('repeat', 1)
+                args.global_repeat = max(
+                    sequence_repeat, args.global_repeat)
         elif args.sequence.startswith('[') and args.sequence.endswith(']'):
-            actions = json.loads(args.sequence)
+            actions = _json_loads(args.sequence)
         else:
             # Parse simple sequence syntax
             actions = parse_simple_sequence(args.sequence)
@@ -2060,33 +2976,35 @@ def main():
     # Handle mouse movement with repeat
     if args.move is not None:
         x, y = args.move
-        for _ in range(args.move_repeat):
-            all_actions.append({
-                'type': 'move',
-                'x': x,
-                'y': y,
-                'delay': args.delay,
-                'check_bounds': not args.ignore_bounds,
-                'smooth': args.smooth or args.global_smooth,
-                'smooth_duration': args.duration if not args.global_smooth else args.global_duration,
-                'smooth_steps': args.steps if not args.global_smooth else args.global_steps,
-                'monitor_index': args.monitor_index
-            })
+        # Build the action once; repeats share the same dict
+        move_action = {
+            'type': 'move',
+            'x': x,
+            'y': y,
+            'delay': args.delay,
+            'check_bounds': args.check_bounds,
+            'smooth': args.smooth or args.global_smooth,
+            'smooth_duration': args.duration if not args.global_smooth else args.global_duration,
+            'smooth_steps': args.steps if not args.global_smooth else args.global_steps,
+            'monitor_index': args.monitor_index,
+            'bounds_policy': args.bounds_policy
+        }
+        all_actions.extend([move_action] * args.move_repeat)
 
     # Handle clicks with repeat
     if args.click or args.right_click or args.double_click:
         button = 'right' if args.right_click else args.global_button
-        for _ in range(args.click_repeat):
-            all_actions.append({
-                'type': 'click',
-                'button': button,
-                'count': 2 if args.double_click else args.click_count,
-                'interval': args.click_interval if not args.global_interval else args.global_interval,
-                'double': args.double_click,
-                'delay_after': args.click_delay
-            })
-
-    # Handle drag operations
+        click_action = {
+            'type': 'click',
+            'button': button,
+            'count': 2 if args.double_click else args.click_count,
+            'interval': args.click_interval if not args.global_interval else args.global_interval,
+            'double': args.double_click,
+            'delay_after': args.click_delay
+        }
+        all_actions.extend([click_action] * args.click_repeat)
+
+    # Handle drag operations; --drag-from first moves to its start point
     if args.drag is not None or args.drag_from is not None:
         if args.drag_from is not None:
             x1, y1, x2, y2 = args.drag_from
@@ -2094,42 +3012,25 @@ def main():
                 'type': 'move',
                 'x': x1,
                 'y': y1,
-                'smooth': not args.no_drag_smooth
-            })
-            if args.click_before_drag:
-                all_actions.append({
-                    'type': 'click',
-                    'button': args.global_button
-                })
-            all_actions.append({
-                'type': 'move',
-                'x': x2,
-                'y': y2,
-                'smooth': not args.no_drag_smooth
+                'smooth': args.drag_smooth
             })
-            if args.click_after_drag:
-                all_actions.append({
-                    'type': 'click',
-                    'button': args.global_button
-                })
         else:
-            dx, dy = args.drag
-            if args.click_before_drag:
-                all_actions.append({
-                    'type': 'click',
-                    'button': args.global_button
-                })
-            all_actions.append({
-                'type': 'move',
-                'x': dx,
-                'y': dy,
-                'smooth': not args.no_drag_smooth
-            })
-            if args.click_after_drag:
-                all_actions.append({
-                    'type': 'click',
-                    'button': args.global_button
-                })
+            x2, y2 = args.drag
+
+        drag_click = {
+            'type': 'click',
+            'button': args.global_button
+        }
+        if args.click_before_drag:
+            all_actions.append(drag_click)
+        all_actions.append({
+            'type': 'move',
+            'x': x2,
+            'y': y2,
+            'smooth': args.drag_smooth
+        })
+        if args.click_after_drag:
+            all_actions.append(drag_click)
 
     # Handle key operations
     if args.key:
@@ -2177,5 +3078,20 @@ def main():
             perform_sequence(all_actions)
 
 
+def _warm_up():
+    """
+    Prime the lazily created controller and cached lookups so that the
+    first mouse action does not pay their setup cost.
+    """
+    _mouse()
+    get_screen_resolution()
+    _ease_curve(100)
+
+
+# Library users can opt in to paying setup costs at import time
+if os.environ.get("A_WARMUP") == "1":
+    _warm_up()
+
+
 if __name__ == "__main__":
     main()